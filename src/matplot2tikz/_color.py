@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -32,13 +33,20 @@ builtin_colors = {
 }
 
 
-def _get_closest_colour_name(rgb: np.ndarray) -> tuple[str, int]:
-    wnames: list[str] = webcolors.names("css3")
-    match = wnames[0]
-    mindiff = 195076  # = 255**2 * 3 + 1 (maximum difference possible + 1)
-    for name in wnames:
-        wc_rgb = webcolors.name_to_rgb(name)
+@functools.cache
+def _webcolors_rgb() -> list[tuple[str, webcolors.IntegerRGB]]:
+    """Return the CSS3 color names with their RGB values, converted only once."""
+    return [(name, webcolors.name_to_rgb(name)) for name in webcolors.names("css3")]
+
 
+# Colormaps produce a limited number of distinct colors, which appear over and over again in, for
+# example, the patches of a mesh. Hence, remember the closest color names.
+@functools.lru_cache(maxsize=4096)
+def _get_closest_colour_name(rgb: tuple[int, int, int]) -> tuple[str, int]:
+    wcolors = _webcolors_rgb()
+    match = wcolors[0][0]
+    mindiff = 195076  # = 255**2 * 3 + 1 (maximum difference possible + 1)
+    for name, wc_rgb in wcolors:
         diff = (
             int(rgb[0] - wc_rgb.red) ** 2
             + int(rgb[1] - wc_rgb.green) ** 2
@@ -95,7 +103,7 @@ def mpl_color2xcolor(
     # convert to RGB255
     rgb255 = np.array(my_col[:3] * 255, dtype=int)
 
-    name, diff = _get_closest_colour_name(rgb255)
+    name, diff = _get_closest_colour_name(tuple(int(val) for val in rgb255))
     if diff > 0:
         if np.all(my_col[0] == my_col[:3]):
             name = f"{name}{rgb255[0]}"
@@ -1,21 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Generator, Iterable
-from itertools import cycle, islice, tee
+from collections.abc import Hashable, Iterable, Iterator, Sequence
+from itertools import cycle, islice, repeat
 from typing import TYPE_CHECKING
 
+import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.patches import Circle, Ellipse, FancyArrowPatch, Patch, Rectangle
-from matplotlib.transforms import Affine2D
+from matplotlib.path import Path
 
 from . import _path as mypath
 from ._text import _get_arrow_style
+from ._util import build_label_index
 
 if TYPE_CHECKING:
     from matplotlib.collections import Collection
 
     from ._tikzdata import TikzData
 
+_RECT_TMPL = "\\draw[%s] %s rectangle %s;\n"
+_ELLIPSE_TMPL = "\\draw[%s] %s ellipse (%s and %s);\n"
+_CIRCLE_TMPL = "\\draw[%s] %s circle (%s);\n"
+
 
 def draw_patch(data: TikzData, obj: Patch) -> list[str]:
     """Return the PGFPlots code for patches."""
@@ -56,53 +62,103 @@ def draw_patch(data: TikzData, obj: Patch) -> list[str]:
     return _draw_polygon(data, obj, draw_options)
 
 
-def _is_in_legend(obj: Collection | Patch) -> bool:
+def _is_in_legend(data: TikzData, obj: Collection | Patch) -> bool:
     label = obj.get_label()
     if obj.axes is None:
         return False
     leg = obj.axes.get_legend()
     if leg is None:
         return False
-    return label in [txt.get_text() for txt in leg.get_texts()]
+    # The texts of a legend are gathered only once, as this is called for every patch
+    if id(leg) not in data.legend_texts:
+        data.legend_texts[id(leg)] = frozenset(txt.get_text() for txt in leg.get_texts())
+    return label in data.legend_texts[id(leg)]
 
 
-def _patch_legend(obj: Collection | Patch, draw_options: list, legend_type: str) -> str:
+def _patch_legend(
+    data: TikzData, obj: Collection | Patch, draw_options: list, legend_type: str
+) -> str:
     """Decorator for handling legend Collection and Patch."""
-    legend = ""
-    if _is_in_legend(obj):
-        # Unfortunately, patch legend entries need \addlegendimage in Pgfplots.
-        do = ", ".join([legend_type, *draw_options]) if draw_options else ""
-        label = obj.get_label()
-        legend += f"\\addlegendimage{{{do}}}\n\\addlegendentry{{{label}}}\n\n"
+    if not _is_in_legend(data, obj):
+        return ""
+
+    # Unfortunately, patch legend entries need \addlegendimage in Pgfplots.
+    do = ", ".join([legend_type, *draw_options]) if draw_options else ""
+    label = obj.get_label()
+    return f"\\addlegendimage{{{do}}}\n\\addlegendentry{{{label}}}\n\n"
+
+
+def zip_modulo(*sequences: Sequence | np.ndarray) -> Iterator[tuple]:
+    """Zip the sequences, repeating the shorter ones until the longest one is exhausted."""
+    max_length = max(len(sequence) for sequence in sequences)
+    if all(len(sequence) == max_length for sequence in sequences):
+        return zip(*sequences)
+
+    # Sequences of length 1 (e.g., a single line width) are simply repeated, others are cycled
+    return islice(
+        zip(
+            *[
+                repeat(sequence[0] if len(sequence) else None)
+                if len(sequence) <= 1
+                else cycle(sequence)
+                for sequence in sequences
+            ]
+        ),
+        max_length,
+    )
+
 
-    return legend
+def _cache_key(x: object) -> Hashable:
+    """Convert a color or line style to something hashable."""
+    if isinstance(x, np.ndarray):
+        return x.tobytes()
+    if isinstance(x, (list, tuple)):
+        return tuple(_cache_key(item) for item in x)
+    return x
 
 
-def zip_modulo(*iterables: Iterable) -> Generator:
-    # Make copies to avoid exhausing any iterables
-    tees = [tee(iterable) for iterable in iterables]
+def _transform_path(path: Path, matrix: np.ndarray, offset: Sequence[float] | np.ndarray) -> Path:
+    """Return the same as `path.transformed(Affine2D(matrix).translate(*offset))`."""
+    matrix_with_offset = np.array(matrix, dtype=float)
+    matrix_with_offset[:2, 2] += offset
+    vertices = np.asarray(path.vertices, dtype=float)
+    return Path(mypath.affine_transform(vertices[None], matrix_with_offset[None])[0], path.codes)
 
-    # Get the length of the longest iterable
-    max_length = max(sum(1 for _ in t[0]) for t in tees)
 
-    # Build infinite cycles for each iterable, then limit it to max_length
-    max_length_iterables = [islice(cycle(t[1]), max_length) for t in tees]
+def _is_identity(
+    transforms: Sequence | np.ndarray, offsets: Sequence | np.ndarray, paths: Sequence[Path]
+) -> bool:
+    """Check whether transforming the paths would leave all of their vertices unchanged.
 
-    for _ in range(max_length):
-        yield tuple(next(iterable) for iterable in max_length_iterables)
+    This is the case if all transforms are the identity and all offsets are zero, except that the
+    transform would turn infinite coordinates into NaNs. (It would also turn -0.0 into 0.0, but
+    that is done anyway when the paths are drawn.)
+    """
+    if transforms[0] is None or not np.all(np.asarray(offsets) == 0):
+        return False
+    if not np.all(np.asarray(transforms) == np.eye(3)):
+        return False
+    return all(np.all(np.isfinite(path.vertices)) for path in paths)
 
 
 def draw_patchcollection(data: TikzData, obj: Collection) -> list[str]:
     """Returns PGFPlots code for a number of patch objects."""
     content = []
 
-    # recompute the face colors
-    obj.update_scalarmappable()
+    # recompute the face colors; this is only needed if they are mapped from an array, or if they
+    # were mapped before the array was removed
+    if (
+        obj.get_array() is not None
+        or getattr(obj, "_face_is_mapped", True)
+        or getattr(obj, "_edge_is_mapped", True)
+    ):
+        obj.update_scalarmappable()
 
-    def ensure_list(x: Iterable | float) -> Iterable:
+    def ensure_list(x: Iterable | float) -> Sequence | np.ndarray:
         if isinstance(x, float):
             return [x]
-        return x if sum(1 for _ in x) else [None]
+        items = x if isinstance(x, (Sequence, np.ndarray)) else list(x)
+        return items if len(items) else [None]
 
     ecs = ensure_list(obj.get_edgecolor())
     fcs = ensure_list(obj.get_facecolor())
@@ -110,22 +166,43 @@ def draw_patchcollection(data: TikzData, obj: Collection) -> list[str]:
     lws = ensure_list(obj.get_linewidth())
     ts = ensure_list(obj.get_transforms())
     offs_tmp = obj.get_offsets()
-    offs = offs_tmp if isinstance(offs_tmp, Iterable) else [offs_tmp]
+    offs = np.asarray(offs_tmp) if isinstance(offs_tmp, Iterable) else [offs_tmp]
 
     paths = obj.get_paths()
-    for path, ec, fc, ls, lw, t, off in zip_modulo(paths, ecs, fcs, lss, lws, ts, offs):
-        draw_options = mypath.get_draw_options(
-            data, mypath.LineData(obj=obj, ec=ec, fc=fc, ls=ls, lw=lw)
-        )
+    # Checked once for the whole collection, so that the paths need not be transformed at all
+    if _is_identity(ts, offs, paths):
+        ts = [None] * len(ts)
+    iterables = (paths, ecs, fcs, lss, lws, ts, offs)
+    straight = mypath.draw_straight_paths(data, paths, ts, offs, max(len(s) for s in iterables))
+    # Within a collection, many items share the same style (e.g., same edge color and line
+    # width), so only compute the draw options (and their joined form) once per unique style.
+    draw_options_cache: dict[tuple, tuple[list[str], str]] = {}
+    for i, (path, ec, fc, ls, lw, t, off) in enumerate(zip_modulo(*iterables)):
+        key = (_cache_key(ec), _cache_key(fc), _cache_key(ls), lw)
+        if key not in draw_options_cache:
+            options = mypath.get_draw_options(
+                data, mypath.LineData(obj=obj, ec=ec, fc=fc, ls=ls, lw=lw)
+            )
+            draw_options_cache[key] = (
+                options,
+                "[{}]".format(", ".join(options)) if options else "",
+            )
+        draw_options, do = draw_options_cache[key]
+        prepared = straight[i] if straight is not None else None
+        if prepared is not None:
+            # Fast path: the coordinates of this path are already computed
+            template, coordinates, is_area = prepared
+            content.append(template % (do, *coordinates))
+            continue
         cont, is_area = mypath.draw_path(
             data,
-            path.transformed(Affine2D(t).translate(*off)) if t is not None else path,
+            _transform_path(path, t, off) if t is not None else path,
             draw_options=draw_options,
         )
         content.append(cont)
 
     legend_type = "area legend" if is_area else "line legend"
-    content.append(_patch_legend(obj, draw_options, legend_type) or "\n")
+    content.append(_patch_legend(data, obj, draw_options, legend_type) or "\n")
 
     return content
 
@@ -133,7 +210,7 @@ def draw_patchcollection(data: TikzData, obj: Collection) -> list[str]:
 def _draw_polygon(data: TikzData, obj: Patch, draw_options: list) -> list[str]:
     str_path, is_area = mypath.draw_path(data, obj.get_path(), draw_options=draw_options)
     legend_type = "area legend" if is_area else "line legend"
-    return [str_path, _patch_legend(obj, draw_options, legend_type)]
+    return [str_path, _patch_legend(data, obj, draw_options, legend_type)]
 
 
 def _draw_rectangle(data: TikzData, obj: Rectangle, draw_options: list) -> list[str]:
@@ -143,16 +220,13 @@ def _draw_rectangle(data: TikzData, obj: Rectangle, draw_options: list) -> list[
     # skipped because they likely correspong to axis/legend objects which are handled by
     # PGFPlots
     label = obj.get_label()
-    #if label == "":
-    #    return []
+    if label == "":
+        return []
 
     # Get actual label, bar charts by default only give rectangles labels of
     # "_nolegend_". See <https://stackoverflow.com/q/35881290/353337>.
     if isinstance(obj.axes, Axes):
-        handles, labels = obj.axes.get_legend_handles_labels()
-        labels_found = [label for h, label in zip(handles, labels) if obj in h.get_children()]
-        if len(labels_found) == 1:
-            label = labels_found[0]
+        label = _label_index(data, obj.axes).get(id(obj), label)
 
     left_lower_x = obj.get_x()
     left_lower_y = obj.get_y()
@@ -163,24 +237,31 @@ def _draw_rectangle(data: TikzData, obj: Rectangle, draw_options: list) -> list[
     if data.current_mpl_axes is not None and data.current_mpl_axes.get_yscale() == "log":
         left_lower_y = data.current_mpl_axes.get_ylim()[0]
 
-    ff = data.float_format
+    axis_cs = mypath.axis_cs_formatter(data.float_format)
     do = ",".join(draw_options)
     right_upper_x = left_lower_x + obj.get_width()
     right_upper_y = left_lower_y + obj.get_height()
     content = [
-        f"\\draw[{do}] (axis cs:{left_lower_x:{ff}},{left_lower_y:{ff}}) "
-        f"rectangle (axis cs:{right_upper_x:{ff}},{right_upper_y:{ff}});\n"
+        _RECT_TMPL
+        % (do, axis_cs((left_lower_x, left_lower_y)), axis_cs((right_upper_x, right_upper_y)))
     ]
 
     if label != "_nolegend_" and str(label) not in data.rectangle_legends:
         data.rectangle_legends.add(str(label))
-        draw_opts = ",".join(draw_options)
-        content.append(f"\\addlegendimage{{ybar,ybar legend,{draw_opts}}}\n")
+        content.append(f"\\addlegendimage{{ybar,ybar legend,{do}}}\n")
         content.append(f"\\addlegendentry{{{label}}}\n\n")
 
     return content
 
 
+def _label_index(data: TikzData, axes: Axes) -> dict[int, str]:
+    """Return the index of legend labels of the axes, which is built only once per axes."""
+    axes_id = id(axes)
+    if axes_id not in data.label_index:
+        data.label_index[axes_id] = build_label_index(axes)
+    return data.label_index[axes_id]
+
+
 def _draw_ellipse(data: TikzData, obj: Ellipse, draw_options: list) -> list[str]:
     """Return the PGFPlots code for ellipses."""
     if isinstance(obj, Circle):
@@ -188,45 +269,42 @@ def _draw_ellipse(data: TikzData, obj: Ellipse, draw_options: list) -> list[str]
         return _draw_circle(data, obj, draw_options)
     x, y = obj.center
     ff = data.float_format
+    center = mypath.axis_cs_formatter(ff)((x, y))
 
     if obj.angle != 0:
-        draw_options.append(f"rotate around={{{obj.angle:{ff}}:(axis cs:{x:{ff}},{y:{ff}})}}")
+        draw_options.append(f"rotate around={{{obj.angle:{ff}}:{center}}}")
 
     do = ",".join(draw_options)
     content = [
-        f"\\draw[{do}] (axis cs:{x:{ff}},{y:{ff}}) ellipse "
-        f"({0.5 * obj.width:{ff}} and {0.5 * obj.height:{ff}});\n"
+        _ELLIPSE_TMPL % (do, center, format(0.5 * obj.width, ff), format(0.5 * obj.height, ff))
     ]
-    content.append(_patch_legend(obj, draw_options, "area legend"))
+    content.append(_patch_legend(data, obj, draw_options, "area legend"))
 
     return content
 
 
 def _draw_circle(data: TikzData, obj: Circle, draw_options: list) -> list[str]:
     """Return the PGFPlots code for circles."""
-    x, y = obj.center
     ff = data.float_format
+    center = mypath.axis_cs_formatter(ff)(tuple(obj.center))
     do = ",".join(draw_options)
     return [
-        f"\\draw[{do}] (axis cs:{x:{ff}},{y:{ff}}) circle ({obj.get_radius():{ff}});\n",
-        _patch_legend(obj, draw_options, "area legend"),
+        _CIRCLE_TMPL % (do, center, format(obj.get_radius(), ff)),
+        _patch_legend(data, obj, draw_options, "area legend"),
     ]
 
 
 def _draw_fancy_arrow(data: TikzData, obj: FancyArrowPatch, draw_options: list) -> list[str]:
     style = _get_arrow_style(data, obj)
-    ff = data.float_format
     if obj._posA_posB is not None:  # type: ignore[attr-defined]  # noqa: SLF001  (no known method to obtain posA and posB)
         pos_a, pos_b = obj._posA_posB  # type: ignore[attr-defined]  # noqa: SLF001
+        axis_cs = mypath.axis_cs_formatter(data.float_format)
         do = ",".join(style)
-        str_path = (
-            f"\\draw[{do}] (axis cs:{pos_a[0]:{ff}},{pos_a[1]:{ff}}) -- "
-            f"(axis cs:{pos_b[0]:{ff}},{pos_b[1]:{ff}});\n"
-        )
+        str_path = f"\\draw[{do}] {axis_cs(tuple(pos_a))} -- {axis_cs(tuple(pos_b))};\n"
     else:
         str_path, _ = mypath.draw_path(
             data,
             obj._path_original,  # type: ignore[attr-defined]  # noqa: SLF001
             draw_options=draw_options + style,
         )
-    return [str_path, _patch_legend(obj, draw_options, "line legend")]
+    return [str_path, _patch_legend(data, obj, draw_options, "line legend")]
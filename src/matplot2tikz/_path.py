@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import contextlib
-from collections.abc import Iterable, Sequence, Sized
+import functools
+from collections.abc import Callable, Iterable, Sequence, Sized
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
@@ -21,7 +22,7 @@ from . import _color, _files
 from ._axes import _mpl_cmap2pgf_cmap
 from ._hatches import _mpl_hatch2pgfp_pattern
 from ._markers import _mpl_marker2pgfp_marker
-from ._util import get_legend_text, has_legend
+from ._util import get_legend_text, has_legend, printf_float_format
 
 
 @dataclass
@@ -74,23 +75,16 @@ def draw_path(
     x_is_date = _check_x_is_date(data)
 
     nodes = []
-    ff = data.float_format
-    xformat = "" if x_is_date else ff
+    axis_cs = axis_cs_formatter(data.float_format, x_is_date=x_is_date)
     prev = None
     is_area = False
     for vert, code in path.iter_segments(simplify=simplify):
         # For path codes see: http://matplotlib.org/api/path_api.html
         is_area = False
         if code == Path.MOVETO:
-            nodes.append(
-                f"(axis cs:{vert[0] if not x_is_date else num2date(vert[0]):{xformat}},"
-                f"{vert[1]:{ff}})"
-            )
+            nodes.append(axis_cs((vert[0], vert[1])))
         elif code == Path.LINETO:
-            nodes.append(
-                f"--(axis cs:{vert[0] if not x_is_date else num2date(vert[0]):{xformat}},"
-                f"{vert[1]:{ff}})"
-            )
+            nodes.append("--" + axis_cs((vert[0], vert[1])))
         elif code == Path.CURVE3:
             # Quadratic Bezier curves aren't natively supported in TikZ, but
             # can be emulated as cubic Beziers.
@@ -110,29 +104,17 @@ def draw_path(
             if prev is None:
                 msg = "Cannot draw quadratic Bezier curves as the beginning of a path"
                 raise ValueError(msg)
-            q1 = list(1.0 / 3.0 * prev + 2.0 / 3.0 * vert[0:2])
-            q2 = list(2.0 / 3.0 * vert[0:2] + 1.0 / 3.0 * vert[2:4])
-            q3 = list(vert[2:4])
-            if x_is_date:
-                q1 = [num2date(q1[0]), q1[1]]
-                q2 = [num2date(q2[0]), q2[1]]
-                q3 = [num2date(q3[0]), q3[1]]
+            q1 = 1.0 / 3.0 * prev + 2.0 / 3.0 * vert[0:2]
+            q2 = 2.0 / 3.0 * vert[0:2] + 1.0 / 3.0 * vert[2:4]
             nodes.append(
-                ".. controls "
-                f"(axis cs:{q1[0]:{xformat}},{q1[1]:{ff}}) and "
-                f"(axis cs:{q2[0]:{xformat}},{q2[1]:{ff}}) .. "
-                f"(axis cs:{q3[0]:{xformat}},{q3[1]:{ff}})"
+                f".. controls {axis_cs((q1[0], q1[1]))} and {axis_cs((q2[0], q2[1]))} .. "
+                f"{axis_cs((vert[2], vert[3]))}"
             )
         elif code == Path.CURVE4:
             # Cubic Bezier curves.
             nodes.append(
-                ".. controls "
-                f"(axis cs:{vert[0] if not x_is_date else num2date(vert[0]):{xformat}},"
-                f"{vert[1]:{ff}}) and "
-                f"(axis cs:{vert[2] if not x_is_date else num2date(vert[2]):{xformat}},"
-                f"{vert[3]:{ff}}) .. "
-                f"(axis cs:{vert[4] if not x_is_date else num2date(vert[4]):{xformat}},"
-                f"{vert[5]:{ff}})"
+                f".. controls {axis_cs((vert[0], vert[1]))} and {axis_cs((vert[2], vert[3]))} .. "
+                f"{axis_cs((vert[4], vert[5]))}"
             )
         else:
             nodes.append("--cycle")
@@ -147,6 +129,135 @@ def draw_path(
     return path_command, is_area
 
 
+@functools.lru_cache
+def axis_cs_formatter(float_format: str, *, x_is_date: bool = False) -> Callable[[tuple], str]:
+    """Return a function that turns a coordinate `(x, y)` into `(axis cs:x,y)`.
+
+    If the float format has a printf-style equivalent, the returned function is a %-template
+    that formats both values at once, which is about twice as fast as an f-string with nested
+    format specifications.
+    """
+    spec = printf_float_format(float_format)
+    if spec is not None and not x_is_date:
+        return f"(axis cs:{spec},{spec})".__mod__
+    if x_is_date:
+        return lambda xy: f"(axis cs:{num2date(xy[0])},{xy[1]:{float_format}})"
+    return lambda xy: f"(axis cs:{xy[0]:{float_format}},{xy[1]:{float_format}})"
+
+
+def draw_straight_paths(
+    data: TikzData,
+    paths: Sequence[Path],
+    transforms: Sequence | np.ndarray,
+    offsets: Iterable,
+    n_items: int,
+) -> list[tuple[str, tuple, bool] | None] | None:
+    """Prepare the PGFPlots code for a collection of paths with straight segments.
+
+    Collections such as meshes consist of many polygons. Instead of calling `draw_path` for each
+    of them, the paths are grouped by their layout (number of vertices and path codes) and the
+    vertices of all items of a group are transformed at once with NumPy. For each of the `n_items`
+    items, the result is a template of the path command (still requiring the draw options and
+    the coordinates), the coordinates, and whether the path is an area. The output is identical
+    to that of `draw_path`.
+
+    Items with anything that `draw_path` treats specially (curves, NaNs, simplification) are
+    `None` and need to be drawn with `draw_path`. If the x-axis holds dates, `None` is returned.
+    """
+    if len(paths) == 0 or _check_x_is_date(data):
+        return None
+
+    # Group the paths by their layout
+    groups: dict[tuple, list[int]] = {}
+    for i, path in enumerate(paths):
+        if not isinstance(path.vertices, np.ndarray) or path.should_simplify:
+            continue
+        codes_key = None if path.codes is None else np.asarray(path.codes).tobytes()
+        groups.setdefault((path.vertices.shape, codes_key), []).append(i)
+
+    index = np.arange(n_items)
+    path_index = index % len(paths)
+    mats = None
+    if transforms[0] is not None:
+        # The transform and offset of each item, like `Affine2D(t).translate(*off)`
+        mats = np.array(transforms, dtype=float)[index % len(transforms)]
+        offs = np.asarray(offsets, dtype=float).reshape(-1, 2)
+        offs = offs[index % len(offs)]
+        mats[:, 0, 2] += offs[:, 0]
+        mats[:, 1, 2] += offs[:, 1]
+
+    # If possible, let the %-operator format the floats directly while filling in the template,
+    # so that no intermediate string is created for each coordinate.
+    ff = data.float_format
+    spec = printf_float_format(ff) or "%s"
+    nodes = {
+        Path.MOVETO: f"(axis cs:{spec},{spec})",
+        Path.LINETO: f"--(axis cs:{spec},{spec})",
+        Path.CLOSEPOLY: "--cycle",
+    }
+
+    result: list[tuple[str, tuple, bool] | None] = [None] * n_items
+    for members in groups.values():
+        codes = _straight_path_codes(paths[members[0]])
+        if codes is None:
+            continue
+        local_index = np.full(len(paths), -1)
+        local_index[members] = np.arange(len(members))
+        items = np.flatnonzero(local_index[path_index] >= 0)
+        verts = np.stack([paths[i].vertices for i in members]).astype(float)
+        verts = verts[local_index[path_index[items]]]
+        # Without transforms, add 0.0 to write -0.0 as 0.0, like `path.iter_segments()` does
+        verts = affine_transform(verts, mats[items]) if mats is not None else verts + 0.0
+        finite = np.all(np.isfinite(verts), axis=(1, 2))
+
+        template = "\\path %s\n" + "\n".join(nodes[code] for code in codes) + ";\n"
+        is_area = bool(codes[-1] == Path.CLOSEPOLY)
+
+        # The vertices of CLOSEPOLY are not written
+        values = verts[:, codes != Path.CLOSEPOLY].reshape(len(items), -1).tolist()
+        for item, row, is_finite in zip(items.tolist(), values, finite.tolist()):
+            if is_finite:
+                coordinates = tuple(format(val, ff) for val in row) if spec == "%s" else tuple(row)
+                result[item] = (template, coordinates, is_area)
+
+    return result
+
+
+def _straight_path_codes(path: Path) -> np.ndarray | None:
+    """Return the path codes, if the path can be drawn by `draw_straight_paths`."""
+    vertices = np.asarray(path.vertices)
+    if vertices.ndim != 2 or len(vertices) <= 2:  # noqa: PLR2004
+        return None
+    if path.codes is None:
+        codes = np.full(len(vertices), Path.LINETO, dtype=Path.code_type)
+        codes[0] = Path.MOVETO
+        return codes
+    codes = np.asarray(path.codes)
+    if codes[0] != Path.MOVETO or not np.all(
+        np.isin(codes, [Path.MOVETO, Path.LINETO, Path.CLOSEPOLY])
+    ):
+        return None
+    return codes
+
+
+def affine_transform(verts: np.ndarray, mats: np.ndarray) -> np.ndarray:
+    """Transform a stack of vertices with a stack of affine matrices.
+
+    The order of operations is the same as in matplotlib, such that the results are identical to
+    those of `path.transformed(...)`.
+    """
+    x, y = verts[..., 0], verts[..., 1]
+    # Non-finite vertices become NaNs, silently, as with `path.transformed(...)`
+    with np.errstate(invalid="ignore", over="ignore"):
+        return np.stack(
+            [
+                mats[:, 0, 0, None] * x + mats[:, 0, 1, None] * y + mats[:, 0, 2, None],
+                mats[:, 1, 0, None] * x + mats[:, 1, 1, None] * y + mats[:, 1, 2, None],
+            ],
+            axis=-1,
+        )
+
+
 def _check_x_is_date(data: TikzData) -> bool:
     if data.current_mpl_axes is None:
         # This shouldn't be the case
@@ -294,36 +294,37 @@ def save(
 
 
 def _generate_code(data: TikzData, content: list) -> str:
-    # write disclaimer to the file header
-    code = """"""
+    # Gather all fragments of the code in a list and join them once at the end
+    code = []
 
+    # write disclaimer to the file header
     if data.include_disclaimer:
         disclaimer = f"This file was created with matplot2tikz v{__version__}."
-        code += _tex_comment(disclaimer)
+        code.append(_tex_comment(disclaimer))
 
     # write the contents
     if data.wrap and data.add_axis_environment:
-        code += data.flavor.start("tikzpicture")
+        code.append(data.flavor.start("tikzpicture"))
         if data.extra_tikzpicture_parameters:
-            code += "[\n" + ",\n".join(data.extra_tikzpicture_parameters) + "\n]"
-        code += "\n"
+            code.append("[\n" + ",\n".join(data.extra_tikzpicture_parameters) + "\n]")
+        code.append("\n")
         if data.extra_lines_start:
-            code += "\n".join(data.extra_lines_start) + "\n"
-        code += "\n"
+            code.append("\n".join(data.extra_lines_start) + "\n")
+        code.append("\n")
 
     coldefs = _get_color_definitions(data)
     if coldefs:
-        code += "\n".join(coldefs) + "\n\n"
+        code.append("\n".join(coldefs) + "\n\n")
 
-    code += "".join(content)
+    code.extend(content)
 
     if data.wrap and data.add_axis_environment:
-        code += data.flavor.end("tikzpicture") + "\n"
+        code.append(data.flavor.end("tikzpicture") + "\n")
 
     if data.standalone:
         # When using pdflatex, \\DeclareUnicodeCharacter is necessary.
-        code = data.flavor.standalone(code)
-    return code
+        return data.flavor.standalone("".join(code))
+    return "".join(code)
 
 
 def _tex_comment(comment: str) -> str:
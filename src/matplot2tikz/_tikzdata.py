@@ -50,6 +50,8 @@ class TikzData:
 
     custom_colors: dict = field(default_factory=dict)
     nb_keys: dict = field(default_factory=dict)
+    label_index: dict = field(default_factory=dict)
+    legend_texts: dict = field(default_factory=dict)
 
     current_mpl_axes: Axes | None = None
 
@@ -43,6 +43,38 @@ def get_legend_text(obj: Line2D | PathCollection) -> str | None:
     return None
 
 
+# Float format specifications for which `("%" + spec) % x` gives the same as `format(x, spec)`
+_PRINTF_FLOAT_FORMAT = re.compile(r"[+ ]?(?:[1-9]\d*)?(?:\.\d+)?[eEfFgG]")
+
+
+def printf_float_format(float_format: str) -> str | None:
+    """Return the printf-style equivalent of a float format specification.
+
+    Formatting many floats with the %-operator on a single template is considerably faster than
+    formatting each float separately. Only simple specifications (sign, width, precision, and
+    type) have an equivalent; for others, `None` is returned.
+    """
+    if _PRINTF_FLOAT_FORMAT.fullmatch(float_format):
+        return "%" + float_format
+    return None
+
+
+def build_label_index(axes: Axes) -> dict[int, str]:
+    """Map the ids of the children of the legend handles of the axes to their legend labels.
+
+    This reverse index lets many objects (e.g., the bars of a bar chart) look up their legend
+    label without going through all legend handles each time. Children that belong to more than
+    one handle are left out, because their label is ambiguous.
+    """
+    handles, labels = axes.get_legend_handles_labels()
+    labels_by_child: dict[int, list[str]] = {}
+    for handle, label in zip(handles, labels):
+        # A set, such that a child is counted only once per handle
+        for child_id in {id(child) for child in handle.get_children()}:
+            labels_by_child.setdefault(child_id, []).append(label)
+    return {child_id: found[0] for child_id, found in labels_by_child.items() if len(found) == 1}
+
+
 def transform_to_data_coordinates(
     obj: Line2D, xdata: np.ndarray, ydata: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]:
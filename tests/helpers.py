@@ -34,18 +34,18 @@ def assert_equality(  # type: ignore[no-untyped-def]
     plot: Callable,
     filename: str,
     flavor: str = "latex",
+    float_format: str = ".8g",
     **extra_get_tikz_code_args,  # noqa: ANN003
 ) -> None:
     plot()
     code = matplot2tikz.get_tikz_code(
         include_disclaimer=False,
-        float_format=".8g",
+        float_format=float_format,
         flavor=flavor,
         **extra_get_tikz_code_args,
     )
     plt.close("all")
 
     this_dir = Path(__file__).resolve().parent
-    with (this_dir / filename).open(encoding="utf-8") as f:
-        reference = f.read()
+    reference = (this_dir / filename).read_text(encoding="utf-8")
     assert reference == code, filename + "\n" + _unidiff_output(reference, code)
@@ -30,6 +30,7 @@ def _main() -> None:
     test_modules.remove("test_deterministic_output")
     test_modules.remove("test_cleanfigure")
     test_modules.remove("test_context")
+    test_modules.remove("test_util")
 
     for mod in test_modules:
         module = importlib.import_module(mod)
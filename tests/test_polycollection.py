@@ -0,0 +1,94 @@
+"""Test a collection of uniform polygons."""
+
+import warnings
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PatchCollection, PolyCollection, RegularPolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Circle, Patch, Polygon
+
+import matplot2tikz
+
+from .helpers import assert_equality
+
+mpl.use("Agg")
+
+
+def plot() -> Figure:
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+
+    # A grid of quads, each with its own color, like a coarse mesh
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, 7), np.linspace(0.0, 1.0, 5))
+    quads = np.stack(
+        [
+            np.stack([x[:-1, :-1], y[:-1, :-1]], axis=-1),
+            np.stack([x[:-1, 1:], y[:-1, 1:]], axis=-1),
+            np.stack([x[1:, 1:], y[1:, 1:]], axis=-1),
+            np.stack([x[1:, :-1], y[1:, :-1]], axis=-1),
+        ],
+        axis=-2,
+    ).reshape(-1, 4, 2)
+    mesh = PolyCollection(quads, cmap=plt.get_cmap("viridis"), edgecolors="k", linewidths=0.5)
+    mesh.set_array(np.sin(3 * quads[:, 0, 0]) * np.cos(2 * quads[:, 0, 1]))
+    ax.add_collection(mesh)
+
+    # Uniform polygons with a transform per item and offsets
+    squares = RegularPolyCollection(
+        4,
+        sizes=(20, 40, 60),
+        offsets=[(1.2, 0.2), (1.2, 0.5), (1.2, 0.8)],
+        facecolors=["r", "g", "b"],
+    )
+    ax.add_collection(squares)
+
+    # Polygons with different numbers of vertices, mixed with a curved patch
+    rng = np.random.default_rng(123)
+    patches: list[Patch] = [
+        Polygon(1.0 + 0.4 * rng.random(size=(n_vertices, 2)), closed=closed)
+        for n_vertices, closed in [(3, True), (5, True), (3, False), (5, True), (4, True)]
+    ]
+    patches.insert(2, Circle((1.3, 0.6), 0.05))
+    polygons = PatchCollection(patches, facecolors="none", edgecolors=["k", "b"])
+    ax.add_collection(polygons)
+
+    # Signed zeros are written as 0
+    triangle = PolyCollection([[(-0.0, 1.2), (0.2, 1.2), (-0.0, 1.4)]])
+    ax.add_collection(triangle)
+
+    # A size of 1 point makes the transform of each item the identity
+    identity = PolyCollection([[(0.2, 1.3), (0.4, 1.3), (0.3, 1.45)]], sizes=[1.0])
+    ax.add_collection(identity)
+    identity_signed_zeros = PolyCollection(
+        [[(-0.0, 1.0), (0.1, 1.0), (-0.0, 1.1)]],
+        sizes=[1.0],
+        facecolors="none",
+        edgecolors="r",
+    )
+    ax.add_collection(identity_signed_zeros)
+
+    ax.set_xlim(0.0, 1.5)
+    ax.set_ylim(0.0, 1.5)
+
+    return fig
+
+
+def test() -> None:
+    assert_equality(plot, __file__[:-3] + "_reference.tex")
+
+
+def test_float_format() -> None:
+    # A float format without a printf-style equivalent, so the coordinates are formatted one by one
+    assert_equality(plot, __file__[:-3] + "_reference_float_format.tex", float_format="_.4f")
+
+
+def test_non_finite_vertices() -> None:
+    fig, ax = plt.subplots()
+    for size in (1.0, 4.0):
+        ax.add_collection(PolyCollection([[(0.0, 0.0), (1.0, 0.0), (1.0, np.inf)]], sizes=[size]))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        matplot2tikz.get_tikz_code(fig)
+    plt.close(fig)
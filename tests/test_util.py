@@ -0,0 +1,22 @@
+"""Test the helper functions of matplot2tikz._util."""
+
+import pytest
+
+from matplot2tikz._util import printf_float_format
+
+
+@pytest.mark.parametrize(
+    "float_format", [".8g", "g", ".3f", "F", "10.4e", ".15g", "+.5e", " .4g", "12E", "3.0G"]
+)
+def test_printf_float_format(float_format: str) -> None:
+    spec = printf_float_format(float_format)
+    assert spec == "%" + float_format
+    for value in (0.0, -0.0, 1.0, -2.5, 1 / 3, 123456.789, 1e-12, 1e20, float("inf")):
+        assert spec % value == format(value, float_format)
+
+
+@pytest.mark.parametrize(
+    "float_format", ["", "_.4f", ",.2f", "#.3g", "08.3f", "-.3f", "<10.3f", ".3%", "d", "n", ".3"]
+)
+def test_printf_float_format_rejected(float_format: str) -> None:
+    assert printf_float_format(float_format) is None